@@ -5,6 +5,19 @@ import torch
 import cupy
 import re
 
+# torch.cuda.amp.custom_fwd / custom_bwd are deprecated since torch 2.4
+if hasattr(torch, 'amp') and hasattr(torch.amp, 'custom_fwd'):
+	def custom_fwd(**kwargs):
+		return torch.amp.custom_fwd(device_type='cuda', **kwargs)
+
+	def custom_bwd(bwd):
+		return torch.amp.custom_bwd(bwd, device_type='cuda')
+
+else:
+	custom_fwd = torch.cuda.amp.custom_fwd
+	custom_bwd = torch.cuda.amp.custom_bwd
+
+
 kernel_Softsplat_updateOutput = '''
 	extern "C" __global__ void kernel_Softsplat_updateOutput(
 		const int n,
@@ -234,6 +247,7 @@ def cupy_launch(strFunction, strKernel):
 
 class _FunctionSoftsplat(torch.autograd.Function):
 	@staticmethod
+	@custom_fwd(cast_inputs=torch.float32)
 	def forward(self, input, flow):
 		self.save_for_backward(input, flow)
 
@@ -269,6 +283,7 @@ class _FunctionSoftsplat(torch.autograd.Function):
 
 
 	@staticmethod
+	@custom_bwd
 	def backward(self, gradOutput):
 		input, flow = self.saved_tensors
 
@@ -324,17 +339,29 @@ class _FunctionSoftsplat(torch.autograd.Function):
 
 
 def FunctionSoftsplat(tenInput, tenFlow, tenMetric, strType):
+	# a list of inputs sharing the same flow is gathered into the kernel input
+	# with a single concatenation, and the warped outputs are returned as a tuple
+	if isinstance(tenInput, (list, tuple)):
+		tenInputs = list(tenInput)
+		intSplits = [ tenOne.shape[1] for tenOne in tenInputs ]
+	else:
+		tenInputs = [ tenInput ]
+		intSplits = None
+
 	assert(tenMetric is None or tenMetric.shape[1] == 1)
 	assert(strType in ['summation', 'average', 'linear', 'softmax'])
 
-	if strType == 'average':
-		tenInput = torch.cat([ tenInput, tenInput.new_ones(tenInput.shape[0], 1, tenInput.shape[2], tenInput.shape[3]) ], 1)
+	if strType == 'summation':
+		tenInput = torch.cat(tenInputs, 1) if len(tenInputs) > 1 else tenInputs[0]
+
+	elif strType == 'average':
+		tenInput = torch.cat(tenInputs + [ tenInputs[0].new_ones(tenInputs[0].shape[0], 1, tenInputs[0].shape[2], tenInputs[0].shape[3]) ], 1)
 
 	elif strType == 'linear':
-		tenInput = torch.cat([ tenInput * tenMetric, tenMetric ], 1)
+		tenInput = torch.cat([ tenOne * tenMetric for tenOne in tenInputs ] + [ tenMetric ], 1)
 
 	elif strType == 'softmax':
-		tenInput = torch.cat([ tenInput * tenMetric.exp(), tenMetric.exp() ], 1)
+		tenInput = torch.cat([ tenOne * tenMetric.exp() for tenOne in tenInputs ] + [ tenMetric.exp() ], 1)
 
 
 	tenOutput = _FunctionSoftsplat.apply(tenInput, tenFlow)
@@ -346,6 +373,9 @@ def FunctionSoftsplat(tenInput, tenFlow, tenMetric, strType):
 
 		tenOutput = tenOutput[:, :-1, :, :] / tenNormalize
 
+	if intSplits is not None:
+		return tenOutput.split(intSplits, 1)
+
 	return tenOutput
 
 
@@ -19,35 +19,67 @@ class SelfAttention(nn.Module):
                 self.head_dim * heads == embed_size
         ), "Embedding size needs to be divisible by heads"
 
-        self.values = nn.Linear(self.head_dim, self.head_dim, bias=False)
-        self.keys = nn.Linear(self.head_dim, self.head_dim, bias=False)
-        self.queries = nn.Linear(self.head_dim, self.head_dim, bias=False)
-        self.fc_out = nn.Linear(heads * self.head_dim, embed_size)
+        # keys and values are both projected from prev_frame, so a single
+        # fused projection is used for the two of them
+        self.keys_values = nn.Linear(embed_size, 2 * embed_size, bias=False)
+        self.queries = nn.Linear(embed_size, embed_size, bias=False)
+        self.fc_out = nn.Linear(embed_size, embed_size)
+
+    def attention_bmm(self, query, keys, values):
+        """Batched-GEMM attention for torch versions without
+        `F.scaled_dot_product_attention`. Heads are folded into the batch
+        dimension so that both products map directly onto `torch.bmm`.
+        """
+        N, heads, query_len, D = query.shape
+        key_len = keys.shape[2]
+        q = query.reshape(N * heads, query_len, D)
+        k = keys.reshape(N * heads, key_len, D)
+        v = values.reshape(N * heads, key_len, D)
+
+        # the 1 / sqrt(D) scale is applied by the GEMM itself (beta=0 ignores
+        # the uninitialized input), saving a pass over the energy tensor
+        energy = torch.baddbmm(
+            q.new_empty(N * heads, query_len, key_len), q, k.transpose(1, 2),
+            beta=0, alpha=1 / math.sqrt(D))
+        attention = torch.softmax(energy, dim=-1)
+        out = torch.bmm(attention, v)
+        return out.view(N, heads, query_len, D)
 
     def forward(self, prev_frame, next_frame):
-        N = prev_frame.shape[0]
+        """Attend from every position of `next_frame` to every position of
+        `prev_frame`. Both are (N, C, height, width) feature maps with
+        C == embed_size, and the output has the shape of `next_frame`.
+        """
+        N, C, height, width = next_frame.shape
+        # (N, C, height, width) -> (N, height * width, C) tokens
+        prev_frame = prev_frame.flatten(2).transpose(1, 2)
+        next_frame = next_frame.flatten(2).transpose(1, 2)
         value_len, key_len, query_len = prev_frame.shape[1], prev_frame.shape[1], next_frame.shape[1]
 
-        values = prev_frame.reshape(N, value_len, self.heads, self.head_dim)
-        keys = values
-        query = next_frame.reshape(N, query_len, self.heads, self.head_dim)
-
-        values = self.values(values)
-        keys = self.keys(keys)
-        query = self.queries(query)
-
-        energy = torch.einsum("nqhd,nkhd->nhqk", [query, keys])
-        attention = torch.softmax(energy / (self.embed_size ** (1 / 2)), dim=3)
-
-        out = torch.einsum("nhql,nlhd->nqhd", [attention, values]).reshape(
-            N, query_len, self.heads, self.head_dim
-        )
-        out_reshaped = out.view(N, query_len, -1)
-
-        out_fc = self.fc_out(out_reshaped)
+        keys, values = self.keys_values(prev_frame).chunk(2, dim=-1)
+        keys = keys.reshape(N, key_len, self.heads, self.head_dim)
+        values = values.reshape(N, value_len, self.heads, self.head_dim)
+        query = self.queries(next_frame).reshape(
+            N, query_len, self.heads, self.head_dim)
+
+        # (N, L, heads, D) -> (N, heads, L, D), the layout expected by the fused
+        # attention kernels
+        keys = keys.transpose(1, 2)
+        values = values.transpose(1, 2)
+        query = query.transpose(1, 2)
+
+        if hasattr(F, "scaled_dot_product_attention"):
+            # scaled by 1 / sqrt(head_dim) inside the kernel
+            out = F.scaled_dot_product_attention(
+                query, keys, values, dropout_p=0.0, is_causal=False)
+        else:
+            out = self.attention_bmm(query, keys, values)
+        # (N, heads, L, D) -> (N, L, heads * D)
+        out = out.transpose(1, 2).flatten(2)
+        out = self.fc_out(out)
 
-        out_fc_reshaped = out_fc.view(N, query_len, self.heads, self.head_dim)
-        return out_fc_reshaped
+        # (N, height * width, C) tokens -> (N, C, height, width)
+        return out.transpose(1, 2).reshape(N, C, height, width)
 
 
 # **************************************************************************************************#
@@ -63,48 +95,51 @@ class FeatPyramid(nn.Module):
         self.conv_stage0 = nn.Sequential(
             nn.Conv2d(in_channels=3, out_channels=16, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=16, out_channels=16, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=16, out_channels=16, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=16, out_channels=16, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
         self.conv_stage1 = nn.Sequential(
             nn.Conv2d(in_channels=16, out_channels=32, kernel_size=3,
                       stride=2, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=32, out_channels=32, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=32, out_channels=32, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=32, out_channels=32, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
         self.conv_stage2 = nn.Sequential(
             nn.Conv2d(in_channels=32, out_channels=64, kernel_size=3,
                       stride=2, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=64, out_channels=64, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=64, out_channels=64, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1),
+            nn.LeakyReLU(inplace=True, negative_slope=0.1),
             nn.Conv2d(in_channels=64, out_channels=64, kernel_size=3,
                       stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
 
     def forward(self, img):
+        # run the convolutions in NHWC layout, and hand NCHW-contiguous
+        # features back to softsplat and correlation
+        img = img.contiguous(memory_format=torch.channels_last)
         C0 = self.conv_stage0(img)
         C1 = self.conv_stage1(C0)
         C2 = self.conv_stage2(C1)
-        return [C0, C1, C2]
+        return [C0.contiguous(), C1.contiguous(), C2.contiguous()]
 
 
 # **************************************************************************************************#
@@ -124,53 +159,79 @@ class MotionEstimator(nn.Module):
         self.conv_layer1 = nn.Sequential(
             nn.Conv2d(in_channels=277, out_channels=160,
                       kernel_size=1, stride=1, padding=0),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
         self.conv_layer2 = nn.Sequential(
             nn.Conv2d(in_channels=160, out_channels=128,
                       kernel_size=3, stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
         self.conv_layer3 = nn.Sequential(
             nn.Conv2d(in_channels=128, out_channels=112,
                       kernel_size=3, stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
         self.conv_layer4 = nn.Sequential(
             nn.Conv2d(in_channels=112, out_channels=96,
                       kernel_size=3, stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
         self.conv_layer5 = nn.Sequential(
             nn.Conv2d(in_channels=96, out_channels=64,
                       kernel_size=3, stride=1, padding=1),
-            nn.LeakyReLU(inplace=False, negative_slope=0.1))
+            nn.LeakyReLU(inplace=True, negative_slope=0.1))
         self.conv_layer6 = nn.Sequential(
             nn.Conv2d(in_channels=64, out_channels=4,
                       kernel_size=3, stride=1, padding=1))
 
     def forward(self, feat0, feat1, last_feat, last_flow):
         corr_fn = correlation.FunctionCorrelation
+        # the flow scale 0.25 * 0.5 is folded into a single multiply
         feat0 = softsplat.FunctionSoftsplat(
-            tenInput=feat0, tenFlow=last_flow[:, :2] * 0.25 * 0.5,
+            tenInput=feat0, tenFlow=last_flow[:, :2] * 0.125,
             tenMetric=None, strType='average')
         feat1 = softsplat.FunctionSoftsplat(
-            tenInput=feat1, tenFlow=last_flow[:, 2:] * 0.25 * 0.5,
+            tenInput=feat1, tenFlow=last_flow[:, 2:] * 0.125,
             tenMetric=None, strType='average')
 
         volume = F.leaky_relu(
             input=corr_fn(tenFirst=feat0, tenSecond=feat1),
-            negative_slope=0.1, inplace=False)
-        input_feat = torch.cat([volume, feat0, feat1, last_feat, last_flow], 1)
-        feat = self.conv_layer1(input_feat)
+            negative_slope=0.1, inplace=True)
+        # concatenate in NHWC, so that the 1x1 `conv_layer1` is evaluated as a
+        # single GEMM over the channel dimension; the following 3x3 layers then
+        # run in channels_last
+        input_feat = torch.cat(
+            [x.permute(0, 2, 3, 1)
+             for x in (volume, feat0, feat1, last_feat, last_flow)], -1)
+        conv1 = self.conv_layer1[0]
+        feat = F.linear(input_feat, conv1.weight.flatten(1), conv1.bias)
+        feat = self.conv_layer1[1](feat.permute(0, 3, 1, 2))
         feat = self.conv_layer2(feat)
         feat = self.conv_layer3(feat)
         feat = self.conv_layer4(feat)
         feat = self.conv_layer5(feat)
         flow = self.conv_layer6(feat)
 
-        return flow, feat
+        return flow.contiguous(), feat.contiguous()
 
 
 # **************************************************************************************************#
 # => Frame Synthesis
 # **************************************************************************************************#
+def merge_refined(refine, warped_img0, warped_img1, time_period):
+    """Blend the warped frames with the predicted masks and add the predicted
+    residual. By default this runs eagerly as separate element-wise kernels;
+    it is only fused into a single kernel when `forward_one_lvl` is compiled,
+    i.e. with `Model(use_compile=True)` (`use_compile` in the pipeline config,
+    `--use_compile` in the tools).
+    """
+    refine_res = torch.sigmoid(refine[:, :3]) * 2 - 1
+    refine_mask0 = torch.sigmoid(refine[:, 3:4])
+    refine_mask1 = torch.sigmoid(refine[:, 4:5])
+
+    merged_img = (warped_img0 * refine_mask0 * (1 - time_period) + warped_img1 * refine_mask1 * time_period)
+    merged_img = merged_img / (refine_mask0 * (1 - time_period) + refine_mask1 * time_period)
+    interp_img = merged_img + refine_res
+    interp_img = torch.clamp(interp_img, 0, 1)
+    return interp_img, refine_res, merged_img
+
+
 class SynthesisNetwork(nn.Module):
     def __init__(self):
         super(SynthesisNetwork, self).__init__()
@@ -234,76 +295,67 @@ class SynthesisNetwork(nn.Module):
                                    i0=None, i1=None, time_period=0.5):
         flow_0t = bi_flow[:, :2] * time_period
         flow_1t = bi_flow[:, 2:4] * (1 - time_period)
-        warped_c0 = softsplat.FunctionSoftsplat(
-            tenInput=c0, tenFlow=flow_0t,
-            tenMetric=None, strType='average')
-        warped_c1 = softsplat.FunctionSoftsplat(
-            tenInput=c1, tenFlow=flow_1t,
-            tenMetric=None, strType='average')
         if (i0 is None) and (i1 is None):
+            warped_c0 = softsplat.FunctionSoftsplat(
+                tenInput=c0, tenFlow=flow_0t,
+                tenMetric=None, strType='average')
+            warped_c1 = softsplat.FunctionSoftsplat(
+                tenInput=c1, tenFlow=flow_1t,
+                tenMetric=None, strType='average')
             return warped_c0, warped_c1
         else:
-            warped_img0 = softsplat.FunctionSoftsplat(
-                tenInput=i0, tenFlow=flow_0t,
+            # features and images sharing a flow are splatted in one call;
+            # 'average' normalizes every channel by the same weights, so this
+            # is identical to warping them separately
+            warped_c0, warped_img0 = softsplat.FunctionSoftsplat(
+                tenInput=[c0, i0], tenFlow=flow_0t,
                 tenMetric=None, strType='average')
-            warped_img1 = softsplat.FunctionSoftsplat(
-                tenInput=i1, tenFlow=flow_1t,
+            warped_c1, warped_img1 = softsplat.FunctionSoftsplat(
+                tenInput=[c1, i1], tenFlow=flow_1t,
                 tenMetric=None, strType='average')
             flow_0t_1t = torch.cat((flow_0t, flow_1t), 1)
             return warped_img0, warped_img1, warped_c0, warped_c1, flow_0t_1t
 
-    def forward(self, last_i_rgb, i0_rgb, i1_rgb, last_i_depth, i0_depth, i1_depth, c0_pyr_rgb, c1_pyr_rgb,
-                c0_pyr_depth, c1_pyr_depth, bi_flow_pyr, time_period=0.5, cross_att=0):
-        # Get warped representations for RGB
-        warped_img0_rgb, warped_img0_depth, warped_img1_depth, warped_img1_rgb, warped_c0, warped_c1, flow_0t_1t_rgb, flow_0t_1t_depth = \
-            self.get_warped_representations(bi_flow_pyr[0], c0_pyr_rgb[0], c1_pyr_rgb[0], i0_rgb, i1_rgb,
-                                            time_period=time_period)
-
-        # Concatenate RGB input features
-        input_feat_rgb = torch.cat((last_i_rgb, warped_img0_rgb, warped_img1_rgb, i0_rgb, i1_rgb, flow_0t_1t_rgb), 1)
-
-        # Get warped representations for Depth
-        _, _, _, _, warped_c0_depth, warped_c1_depth, _, _ = \
-            self.get_warped_representations(bi_flow_pyr[0], c0_pyr_depth[0], c1_pyr_depth[0], i0_depth, i1_depth,
-                                            time_period=time_period)
-
-        # Concatenate Depth input features
-        input_feat_depth = torch.cat(
-            (last_i_depth, warped_img0_depth, warped_img1_depth, i0_depth, i1_depth, flow_0t_1t_depth), 1)
-
-        # Concatenate RGB and Depth input features
-        input_feat = torch.cat((input_feat_rgb, input_feat_depth), 1)
+    def forward(self, last_i, i0, i1, c0_pyr, c1_pyr, bi_flow_pyr,
+                time_period=0.5):
+        warped_img0, warped_img1, warped_c0, warped_c1, flow_0t_1t = \
+            self.get_warped_representations(
+                bi_flow_pyr[0], c0_pyr[0], c1_pyr[0], i0, i1,
+                time_period=time_period)
+        input_feat = torch.cat(
+            (last_i, warped_img0, warped_img1, i0, i1, flow_0t_1t), 1)
 
         # Encoder layers
         s0 = self.encoder_conv(input_feat)
-        s1 = self.encoder_down1(torch.cat((s0, warped_c0, warped_c1, warped_c0_depth, warped_c1_depth), 1))
-        s2 = self.encoder_down2(torch.cat((s1, warped_c0, warped_c1, warped_c0_depth, warped_c1_depth), 1))
+        s1 = self.encoder_down1(torch.cat((s0, warped_c0, warped_c1), 1))
+        warped_c0, warped_c1 = self.get_warped_representations(
+            bi_flow_pyr[1], c0_pyr[1], c1_pyr[1],
+            time_period=time_period)
+        s2 = self.encoder_down2(torch.cat((s1, warped_c0, warped_c1), 1))
+        warped_c0, warped_c1 = self.get_warped_representations(
+            bi_flow_pyr[2], c0_pyr[2], c1_pyr[2],
+            time_period=time_period)
 
-        # Attention mechanism for feature fusion
-        cross_att = self.self_attention(cross_att, cross_att)
+        x = self.decoder_up1(torch.cat((s2, warped_c0, warped_c1), 1))
 
-        # Adapted for multimodal fusion
-        x = self.decoder_up1(torch.cat((s2, warped_c0, warped_c1, warped_c0_depth, warped_c1_depth), 1))
-        x = self.decoder_up2(torch.cat((cross_att, s1), 1))
+        # Attention mechanism for feature fusion, over the 64-channel decoder
+        # features at the resolution of s1
+        x = self.self_attention(x, x)
+        x = self.decoder_up2(torch.cat((x, s1), 1))
 
         # Decoder and prediction
         x = self.decoder_conv(torch.cat((x, s0), 1))
         refine = self.pred(x)
-        refine_res = torch.sigmoid(refine[:, :3]) * 2 - 1
-        refine_mask0 = torch.sigmoid(refine[:, 3:4])
-        refine_mask1 = torch.sigmoid(refine[:, 4:5])
 
         # Merged image
-        merged_img = (warped_img0_rgb * refine_mask0 * (1 - time_period) + warped_img1_rgb * refine_mask1 * time_period)
-        merged_img = merged_img / (refine_mask0 * (1 - time_period) + refine_mask1 * time_period)
-        interp_img = merged_img + refine_res
-        interp_img = torch.clamp(interp_img, 0, 1)
+        interp_img, refine_res, merged_img = merge_refined(
+            refine, warped_img0, warped_img1, time_period)
 
         # Extra information for analysis
         extra_dict = {}
         extra_dict["refine_res"] = refine_res
-        extra_dict["warped_img0"] = warped_img0_rgb
-        extra_dict["warped_img1"] = warped_img1_rgb
+        extra_dict["warped_img0"] = warped_img0
+        extra_dict["warped_img1"] = warped_img1
         extra_dict["merged_img"] = merged_img
 
         return interp_img, extra_dict
@@ -313,28 +365,62 @@ class SynthesisNetwork(nn.Module):
 # => Unified model
 # **************************************************************************************************#
 class Model(nn.Module):
-    def __init__(self, pyr_level=3, nr_lvl_skipped=0):
+    def __init__(self, pyr_level=3, nr_lvl_skipped=0, use_bf16=False,
+                 use_compile=False):
         super(Model, self).__init__()
         self.pyr_level = pyr_level
         self.nr_lvl_skipped = nr_lvl_skipped
+        # opt-in BF16 autocast, only applied at inference
+        self.use_bf16 = use_bf16
         # Enable UPR-Net to process multi-modal data and achieve adaptive frame
-        self.feat_pyramid = FeatPyramid()
-        self.motion_estimator = MotionEstimator()
+        self.feat_pyramid = FeatPyramid().to(memory_format=torch.channels_last)
+        self.motion_estimator = MotionEstimator().to(
+            memory_format=torch.channels_last)
         self.synthesis_network = SynthesisNetwork()
+        # opt-in torch.compile of `forward_one_lvl`, see `get_forward_one_lvl`
+        self.use_compile = use_compile and hasattr(torch, "compile")
+        self.compiled_forward_one_lvl = None
+
+    def __getstate__(self):
+        # the compiled function is rebuilt on demand and is not picklable
+        state = self.__dict__.copy()
+        state["compiled_forward_one_lvl"] = None
+        return state
+
+    def get_forward_one_lvl(self):
+        """Return `forward_one_lvl`, compiled with TorchInductor when
+        `use_compile` is set. The compiled function is built on first use and
+        cached on this instance; the softsplat and correlation cupy kernels run
+        eagerly between graphs.
+        """
+        if not self.use_compile:
+            return self.forward_one_lvl
+        if self.compiled_forward_one_lvl is None:
+            self.compiled_forward_one_lvl = torch.compile(
+                self.forward_one_lvl, dynamic=True,
+                mode="max-autotune-no-cudagraphs")
+        return self.compiled_forward_one_lvl
 
     def forward_one_lvl(self,
                         img0, img1, last_feat, last_flow, last_interp=None,
                         time_period=0.5, skip_me=False):
 
-        # context feature extraction
-        feat0_pyr = self.feat_pyramid(img0)
-        feat1_pyr = self.feat_pyramid(img1)
+        # context feature extraction, with both frames stacked along the batch
+        # dimension of a single pyramid pass
+        feat_pyr = self.feat_pyramid(torch.cat((img0, img1), 0))
+        feat0_pyr = [feat[:img0.shape[0]] for feat in feat_pyr]
+        feat1_pyr = [feat[img0.shape[0]:] for feat in feat_pyr]
 
         # bi-directional flow estimation
         if not skip_me:
-            flow, feat = self.motion_estimator(
-                feat0_pyr[-1], feat1_pyr[-1],
-                last_feat, last_flow)
+            # flows are in full-resolution pixels and would be rounded to
+            # 0.5-1 px steps in BF16 for large motions, so the motion
+            # estimator runs in FP32; the flow up-sampling and pyramid below
+            # then stay in FP32 too
+            with torch.autocast(device_type="cuda", enabled=False):
+                flow, feat = self.motion_estimator(
+                    feat0_pyr[-1].float(), feat1_pyr[-1].float(),
+                    last_feat.float(), last_flow.float())
         else:
             flow = last_flow
             feat = last_feat
@@ -350,9 +436,9 @@ class Model(nn.Module):
         tmp_flow = ori_resolution_flow
         bi_flow_pyr.append(tmp_flow)
         for i in range(2):
-            tmp_flow = F.interpolate(
-                input=tmp_flow, scale_factor=0.5,
-                mode="bilinear", align_corners=False) * 0.5
+            # 2x2 average pool (identical to a 0.5x bilinear resize on even
+            # sizes) with the 0.5 flow rescale folded into the divisor
+            tmp_flow = F.avg_pool2d(tmp_flow, kernel_size=2, divisor_override=8)
             bi_flow_pyr.append(tmp_flow)
 
         ## merge warped frames as initial interpolation for frame synthesis
@@ -381,24 +467,25 @@ class Model(nn.Module):
         if pyr_level is None: pyr_level = self.pyr_level
         if nr_lvl_skipped is None: nr_lvl_skipped = self.nr_lvl_skipped
         N, _, H, W = img0.shape
+        use_bf16 = self.use_bf16 and (not self.training) and img0.is_cuda \
+            and torch.cuda.is_bf16_supported()
+        forward_one_lvl = self.get_forward_one_lvl()
         bi_flows = []
         interp_imgs = []
         skipped_levels = [] if nr_lvl_skipped == 0 else \
             list(range(pyr_level))[::-1][-nr_lvl_skipped:]
 
-        # The original input resolution corresponds to level 0.
+        # The original input resolution corresponds to level 0. Each level is
+        # down-sampled from the previous one, rather than from full resolution.
+        img0_pyr = [img0]
+        img1_pyr = [img1]
+        for level in range(1, pyr_level):
+            img0_pyr.append(F.avg_pool2d(img0_pyr[-1], kernel_size=2))
+            img1_pyr.append(F.avg_pool2d(img1_pyr[-1], kernel_size=2))
+
         for level in list(range(pyr_level))[::-1]:
-            if level != 0:
-                scale_factor = 1 / 2 ** level
-                img0_this_lvl = F.interpolate(
-                    input=img0, scale_factor=scale_factor,
-                    mode="bilinear", align_corners=False)
-                img1_this_lvl = F.interpolate(
-                    input=img1, scale_factor=scale_factor,
-                    mode="bilinear", align_corners=False)
-            else:
-                img0_this_lvl = img0
-                img1_this_lvl = img1
+            img0_this_lvl = img0_pyr[level]
+            img1_this_lvl = img1_pyr[level]
 
             # skip motion estimation, directly use up-sampled optical flow
             skip_me = False
@@ -406,11 +493,11 @@ class Model(nn.Module):
             # the lowest-resolution pyramid level
             if level == pyr_level - 1:
                 last_flow = torch.zeros(
-                    (N, 4, H // (2 ** (level + 2)), W // (2 ** (level + 2)))
-                ).to(img0.device)
+                    (N, 4, H // (2 ** (level + 2)), W // (2 ** (level + 2))),
+                    device=img0.device, dtype=img0.dtype)
                 last_feat = torch.zeros(
-                    (N, 64, H // (2 ** (level + 2)), W // (2 ** (level + 2)))
-                ).to(img0.device)
+                    (N, 64, H // (2 ** (level + 2)), W // (2 ** (level + 2))),
+                    device=img0.device, dtype=img0.dtype)
                 last_interp = None
             # skip some levels for both motion estimation and frame synthesis
             elif level in skipped_levels[:-1]:
@@ -419,7 +506,8 @@ class Model(nn.Module):
             elif (level == 0) and len(skipped_levels) > 0:
                 if len(skipped_levels) == pyr_level:
                     last_flow = torch.zeros(
-                        (N, 4, H // 4, W // 4)).to(img0.device)
+                        (N, 4, H // 4, W // 4),
+                        device=img0.device, dtype=img0.dtype)
                     last_interp = None
                 else:
                     resize_factor = 2 ** len(skipped_levels)
@@ -441,19 +529,23 @@ class Model(nn.Module):
                     input=interp_img, scale_factor=2.0,
                     mode="bilinear", align_corners=False)
 
-            flow, feat, interp_img, _ = self.forward_one_lvl(
-                img0_this_lvl, img1_this_lvl,
-                last_feat, last_flow, last_interp,
-                time_period, skip_me=skip_me)
+            # run each level in BF16 where supported, except for the motion
+            # estimator; softsplat and correlation cast their inputs back to
+            # FP32 themselves
+            with torch.autocast(device_type="cuda", dtype=torch.bfloat16,
+                                enabled=use_bf16):
+                flow, feat, interp_img, _ = forward_one_lvl(
+                    img0_this_lvl, img1_this_lvl,
+                    last_feat, last_flow, last_interp,
+                    time_period, skip_me=skip_me)
+            flow, feat, interp_img = flow.float(), feat.float(), interp_img.float()
             bi_flows.append(
                 F.interpolate(input=flow, scale_factor=4.0,
                               mode="bilinear", align_corners=False))
 
-        # directly up-sample estimated flow to full resolution with bi-linear
-        # interpolation
-        bi_flow = F.interpolate(
-            input=flow, scale_factor=4.0,
-            mode="bilinear", align_corners=False)
+        # the estimated flow of the last processed level, already up-sampled to
+        # full resolution with bi-linear interpolation
+        bi_flow = bi_flows[-1]
 
         interp_imgs.append(interp_img)
 
@@ -113,14 +113,22 @@ class Pipeline:
                 if "load_pretrain" in model_cfg_dict else False
         model_file = model_cfg_dict["model_file"] \
                 if "model_file" in model_cfg_dict else ""
+        use_bf16 = model_cfg_dict["use_bf16"] \
+                if "use_bf16" in model_cfg_dict else False
+        use_compile = model_cfg_dict["use_compile"] \
+                if "use_compile" in model_cfg_dict else False
 
         # instantiate model
+        if (use_bf16 or use_compile) and model_size != "base":
+            raise ValueError(
+                    "use_bf16 and use_compile are only supported by the base model")
         if model_size == "LARGE":
             self.model = LARGE_model(pyr_level, nr_lvl_skipped)
         elif model_size == "large":
             self.model = large_model(pyr_level, nr_lvl_skipped)
         else:
-            self.model = base_model(pyr_level, nr_lvl_skipped)
+            self.model = base_model(pyr_level, nr_lvl_skipped,
+                    use_bf16=use_bf16, use_compile=use_compile)
 
         # load pretrained model weight
         if load_pretrain:
@@ -5,6 +5,22 @@ import torch
 import cupy
 import re
 
+# torch.cuda.amp.custom_fwd / custom_bwd are deprecated since torch 2.4
+if hasattr(torch, 'amp') and hasattr(torch.amp, 'custom_fwd'):
+	def custom_fwd(**kwargs):
+		return torch.amp.custom_fwd(device_type='cuda', **kwargs)
+	# end
+
+	def custom_bwd(bwd):
+		return torch.amp.custom_bwd(bwd, device_type='cuda')
+	# end
+
+else:
+	custom_fwd = torch.cuda.amp.custom_fwd
+	custom_bwd = torch.cuda.amp.custom_bwd
+
+# end
+
 kernel_Correlation_rearrange = '''
 	extern "C" __global__ void kernel_Correlation_rearrange(
 		const int n,
@@ -277,6 +293,7 @@ def cupy_launch(strFunction, strKernel):
 
 class _FunctionCorrelation(torch.autograd.Function):
 	@staticmethod
+	@custom_fwd(cast_inputs=torch.float32)
 	def forward(self, first, second):
 		rbot0 = first.new_zeros([ first.shape[0], first.shape[2] + 8, first.shape[3] + 8, first.shape[1] ])
 		rbot1 = first.new_zeros([ first.shape[0], first.shape[2] + 8, first.shape[3] + 8, first.shape[1] ])
@@ -330,6 +347,7 @@ class _FunctionCorrelation(torch.autograd.Function):
 	# end
 
 	@staticmethod
+	@custom_bwd
 	def backward(self, gradOutput):
 		first, second, rbot0, rbot1 = self.saved_tensors
 
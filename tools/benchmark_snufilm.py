@@ -136,6 +136,11 @@ if __name__ == "__main__":
     parser.add_argument('--model_file', type=str,
             default="./checkpoints/upr-base.pkl",
             help='weight of UPR-Net')
+    parser.add_argument('--use_bf16', action='store_true',
+            help='run the base model under BF16 autocast')
+    parser.add_argument('--use_compile', action='store_true',
+            help='compile the per-level pipeline of the base model with '\
+                    'torch.compile')
 
     ## test large version of UPR-Net
     # parser.add_argument('--model_size', type=str, default="large",
@@ -165,10 +170,16 @@ if __name__ == "__main__":
     # => init the pipeline and start to benchmark
     args = parser.parse_args()
 
+    # TF32 matmuls, for the base model only
+    if args.model_size == "base":
+        torch.backends.cuda.matmul.allow_tf32 = True
+
     model_cfg_dict = dict(
             load_pretrain = True,
             model_size = args.model_size,
-            model_file = args.model_file
+            model_file = args.model_file,
+            use_bf16 = args.use_bf16,
+            use_compile = args.use_compile
             )
     ppl = Pipeline(model_cfg_dict)
 
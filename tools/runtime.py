@@ -5,18 +5,24 @@ import time
 from core.pipeline import Pipeline
 
 
-def test_runtime(model_size="base"):
+def test_runtime(model_size="base", use_bf16=False, use_compile=False):
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
     torch.set_grad_enabled(False)
     if torch.cuda.is_available():
         torch.backends.cudnn.enabled = True
         torch.backends.cudnn.benchmark = True
+        # TF32 matmuls, for the base model only
+        if model_size == "base":
+            torch.backends.cuda.matmul.allow_tf32 = True
     if model_size not in ("base", "large", "LARGE"):
         raise ValueError("model_size must be one of ('base', 'large', 'LARGE')")
     else:
         model_cfg_dict = dict(
                 pyr_level=3,
                 load_pretrain=False,
+                model_size=model_size,
+                use_bf16=use_bf16,
+                use_compile=use_compile,
                 )
 
     ppl = Pipeline(model_cfg_dict)
@@ -43,6 +49,15 @@ def test_runtime(model_size="base"):
 
 
 if __name__ == "__main__":
-    # "base", "large", or "LARGE"
-    model_size = "base"
-    test_runtime(model_size)
+    parser = argparse.ArgumentParser(description='runtime of UPR-Net')
+    parser.add_argument('--model_size', type=str, default="base",
+            help='model size, one of (base, large, LARGE)')
+    parser.add_argument('--use_bf16', action='store_true',
+            help='run the base model under BF16 autocast')
+    parser.add_argument('--use_compile', action='store_true',
+            help='compile the per-level pipeline of the base model with '\
+                    'torch.compile')
+    args = parser.parse_args()
+
+    test_runtime(args.model_size, use_bf16=args.use_bf16,
+            use_compile=args.use_compile)